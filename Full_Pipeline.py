@@ -2,19 +2,16 @@ import numpy as np
 import pandas as pd
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
+from scipy.spatial import cKDTree
 from scipy.ndimage import gaussian_filter 
 import HockeyRink
+from func_class import load_clean_shots
 
-data = pd.read_csv("shots_2023.csv")
+# Same cleansing rules as the reports: 5 v 5, no empty-net shots, no shots from behind the net
+data = load_clean_shots("shots_2023.csv")
 
 # print(data.head())
 
-data = data[(data['awaySkatersOnIce'] == 5) & (data['homeSkatersOnIce'] == 5)]
-data = data[data['shotDistance'] <= 89]
-data = data[data['shotOnEmptyNet'] == 0]
-data = data[data['xCordAdjusted'] <= 89]
-
 # Prints the max % that a shot would be a goal, 
 #   avg % that a shot would be a goal (xGoal),
 #   Cordinates have been adjusted to show as if they happened in the offensive zone
@@ -26,12 +23,27 @@ data = data[data['xCordAdjusted'] <= 89]
 
 
 # Creating an array of the xGoal values from the data
-#  "gridData" allows us to fill the missing gaps in the data, and we fill the negative 
-#   values with 0 because negative 'Xgoals' are not possible in reality (every shot has some probability of going in)
-[x,y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-xgoals = griddata((data['xCordAdjusted'],data['yCordAdjusted']),
-    data['xGoal'],(x,y),method='cubic',fill_value=0)
-xgoals = np.where(xgoals < 0,0,xgoals)
+#  Inverse-distance weighting of the 16 nearest shots allows us to fill the missing gaps in the data;
+#   unlike a cubic "griddata" it needs no triangulation of every shot, and as a weighted average
+#   of real xGoals it is never negative (every shot has some probability of going in)
+# The same grid is reused for every map below; it is left unrounded so grid points
+#   stay evenly spaced instead of snapping to the nearest foot
+x, y = np.meshgrid(np.linspace(0, 100, 100, dtype=np.float32), np.linspace(-42.5, 42.5, 85, dtype=np.float32))
+grid_points = np.c_[x.ravel(), y.ravel()]
+
+def idw_xgoals(shots, k=16):
+    # Players with fewer than k shots use all of them, so every map is filled the same way
+    k = min(k, len(shots))
+    tree = cKDTree(np.c_[shots['xCordAdjusted'], shots['yCordAdjusted']])
+    dist, idx = tree.query(grid_points, k=k, workers=-1)
+    # query drops the neighbour axis when k is 1
+    dist, idx = dist.reshape(len(grid_points), k), idx.reshape(len(grid_points), k)
+    weights = 1.0 / (dist + 1e-6)
+    weights /= weights.sum(axis=1, keepdims=True)
+    # float32 like the shot data, so the smoothing and plotting below move half the bytes
+    return (weights * shots['xGoal'].to_numpy()[idx]).sum(axis=1).reshape(x.shape).astype(np.float32)
+
+xgoals = idw_xgoals(data)
 
 # fig = plt.figure(figsize=(10,12), facecolor='w', edgecolor='k')
 # plt.imshow(xgoals,origin = 'lower')
@@ -56,9 +68,8 @@ plt.show()
 player_name = 'Connor McDavid'
 player_shots = data[data['shooterName'] == player_name]
 
-[x,y] = np.round(np.meshgrid(np.linspace(0,100,100),np.linspace(-42.5,42.5,85)))
-xgoals_player = griddata((player_shots['xCordAdjusted'],player_shots['yCordAdjusted']),player_shots['xGoal'],(x,y),method='cubic',fill_value=0)
-xgoals_player = np.where(xgoals_player < 0,0,xgoals_player)
+# Same interpolation as the league map, so the difference below is comparable at any sample size
+xgoals_player = idw_xgoals(player_shots)
 
 player_shots_smooth = gaussian_filter(xgoals_player,sigma = 3)
 
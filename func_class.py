@@ -1,14 +1,80 @@
+import functools
+import hashlib
+import io
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
 import tempfile
 import shutil
 from fpdf import FPDF
 import os
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-from scipy.interpolate import griddata
-from scipy.ndimage import gaussian_filter
+from matplotlib import cm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from scipy.ndimage import correlate1d
+from PIL import Image
 import HockeyRink  # Make sure your HockeyRink module is correctly set up
 
+# Columns of the shots CSV used by the reports, with the narrowest dtype that holds them
+SHOT_COLUMNS = [
+    'shooterName', 'event', 'xCordAdjusted', 'yCordAdjusted', 'xGoal', 'shotDistance',
+    'awaySkatersOnIce', 'homeSkatersOnIce', 'shotOnEmptyNet'
+]
+SHOT_DTYPES = {
+    'shooterName': 'category',
+    'event': 'category',
+    'xCordAdjusted': 'float32',
+    'yCordAdjusted': 'float32',
+    'xGoal': 'float32',
+    'shotDistance': 'float32',
+    'awaySkatersOnIce': 'int8',
+    'homeSkatersOnIce': 'int8',
+    'shotOnEmptyNet': 'int8',
+}
+
+def shots_cache_file(data_file):
+    """
+    Returns the path of the Parquet cache of a shots CSV. Its name carries a key of SHOT_COLUMNS
+    and SHOT_DTYPES, so changing either makes loads rebuild the cache instead of reading a file
+    written with other columns.
+
+    Args:
+        data_file (str): Path to the CSV file containing shot data.
+
+    Returns:
+        str: Path of the Parquet file next to the CSV.
+    """
+    schema = repr([(column, SHOT_DTYPES.get(column)) for column in SHOT_COLUMNS])
+    schema_key = hashlib.md5(schema.encode()).hexdigest()[:8]
+    return f"{os.path.splitext(data_file)[0]}.{schema_key}.parquet"
+
+def load_shots(data_file):
+    """
+    Loads the report columns of the shots CSV. The first load saves them as a Parquet file
+    next to the CSV, which later loads read instead until the CSV is modified again. The cache is
+    optional: if it cannot be read or written, the CSV is used as if it did not exist.
+
+    Args:
+        data_file (str): Path to the CSV file containing shot data.
+
+    Returns:
+        DataFrame: Raw shot data restricted to SHOT_COLUMNS.
+    """
+    parquet_file = shots_cache_file(data_file)
+    if os.path.exists(parquet_file) and os.path.getmtime(parquet_file) >= os.path.getmtime(data_file):
+        try:
+            return pd.read_parquet(parquet_file, columns=SHOT_COLUMNS)
+        except Exception as e:
+            print(f"Error reading shot cache {parquet_file}, loading the CSV instead: {e}")
+
+    data = pd.read_csv(data_file, usecols=SHOT_COLUMNS, dtype=SHOT_DTYPES)
+    try:
+        data.to_parquet(parquet_file)
+    except (OSError, ImportError) as e:
+        print(f"Error writing shot cache {parquet_file}: {e}")
+    return data
+
 # Step 1: Data Cleansing Function
 def import_clean_data(data_file):
     """
@@ -24,13 +90,157 @@ def import_clean_data(data_file):
     Returns:
         DataFrame: Cleaned DataFrame with shot data.
     """
-    data = pd.read_csv(data_file)
-    data = data[(data['awaySkatersOnIce'] == 5) & (data['homeSkatersOnIce'] == 5)]
-    data = data[data['shotDistance'] <= 89]
-    data = data[data['shotOnEmptyNet'] == 0]
-    data = data[data['xCordAdjusted'] <= 89]
+    data = load_shots(data_file)
+
+    # Combine every rule into one mask so the filtered frame is only copied once
+    mask = (
+        (data['awaySkatersOnIce'] == 5) & (data['homeSkatersOnIce'] == 5)
+        & (data['shotDistance'] <= 89)
+        & (data['shotOnEmptyNet'] == 0)
+        & (data['xCordAdjusted'] <= 89)
+    )
+    data = data.loc[mask].reset_index(drop=True)
+
+    # Keep shooter names categorical so name lookups compare integer codes, and drop the
+    # shooters that only appear in filtered-out situations
+    data['shooterName'] = data['shooterName'].astype('category').cat.remove_unused_categories()
     return data
 
+@functools.lru_cache(maxsize=1)
+def load_clean_shots(data_file="shots_2023.csv"):
+    """
+    Returns the cleaned shot data from `import_clean_data`, loading it only once per process so
+    every script and report sharing a process reuses the same DataFrame. Callers must treat the
+    returned DataFrame as read-only.
+
+    Args:
+        data_file (str): Path to the CSV file containing shot data.
+
+    Returns:
+        DataFrame: Cleaned DataFrame with shot data.
+    """
+    return import_clean_data(data_file)
+
+# Heatmap grid shared by every heatmap: (rows, columns) of 1 ft cells over the offensive half of
+# the rink, with rows starting at the bottom boards and columns at centre ice
+GRID_SHAPE = (85, 100)
+GRID_Y_MIN = -42.5
+
+# Columns up to and including the goal line, the part of the grid shown on comparison heatmaps
+PLOTTED_COLUMNS = 90
+
+def gaussian_kernel(sigma, truncate=4.0):
+    """
+    Builds the normalised 1-D Gaussian weights used by scipy's gaussian_filter.
+
+    Args:
+        sigma (float): Standard deviation of the Gaussian, in grid cells.
+        truncate (float): Number of standard deviations after which the kernel is cut off.
+
+    Returns:
+        np.array: Kernel weights of length 2 * round(truncate * sigma) + 1.
+    """
+    radius = int(truncate * sigma + 0.5)
+    kernel = np.exp(-0.5 * (np.arange(-radius, radius + 1) / sigma) ** 2)
+    return kernel / kernel.sum()
+
+# Heatmap smoothing kernel, built once and reused by every heatmap. Cutting it off at 3 sigma
+# (19 taps instead of 25) only drops weights of about 1% of the peak or less
+SMOOTHING_KERNEL = gaussian_kernel(sigma=3, truncate=3.0)
+
+# Smoothed shot count of a single isolated shot at its own cell. Averages are divided by at least
+# this much, so where shots thin out the heatmap fades to 0 with the smoothed xGoal sum instead of
+# holding the full local average up to the edge of the kernel and then dropping off
+MIN_SMOOTHED_COUNT = float(SMOOTHING_KERNEL.max() ** 2)
+
+def smooth_grid(grid):
+    """
+    Gaussian-smooths the rink axes (the last two) of a grid or a stack of grids, applying the
+    precomputed SMOOTHING_KERNEL as two separable 1-D passes. Same result as
+    gaussian_filter(grid, sigma=3, truncate=3.0) on each rink grid, without rebuilding the
+    weights per call.
+
+    Args:
+        grid (np.array): Array whose last two axes are (y, x) rink cells.
+
+    Returns:
+        np.array: Smoothed array of the same shape.
+    """
+    grid = correlate1d(grid, SMOOTHING_KERNEL, axis=-1, mode='reflect')
+    return correlate1d(grid, SMOOTHING_KERNEL, axis=-2, mode='reflect')
+
+def smooth_xgoals_batch(groups, n_groups, x, y, xgoal):
+    """
+    Turns shot locations and their xGoal values into one smoothed average xGoal grid per group,
+    each covering the offensive half of the rink (85 x 100 cells of 1 ft).
+
+    All groups are binned together with a single index computation and two bincount passes
+    into a (n_groups, 85, 100) stack, then the xGoal sums and shot counts are smoothed over the
+    rink axes only and divided, so every cell holds the local average xGoal around it. Cells with
+    less than one shot's worth of smoothed count fade towards 0, and the columns behind the goal
+    line are left at 0.
+
+    Args:
+        groups (np.array): Group number (0 to n_groups - 1) of each shot.
+        n_groups (int): Number of grids to produce.
+        x (np.array): Adjusted x coordinates of the shots (0 to 100).
+        y (np.array): Adjusted y coordinates of the shots (-42.5 to 42.5).
+        xgoal (np.array): xGoal value of each shot.
+
+    Returns:
+        np.array: Smoothed xGoals arrays of shape (n_groups, 85, 100), indexed [group, y, x].
+    """
+    n_rows, n_columns = GRID_SHAPE
+    shape = (n_groups, n_rows, n_columns)
+
+    ix = np.floor(x).astype(np.intp)
+    iy = np.floor(y - GRID_Y_MIN).astype(np.intp)
+    on_grid = (ix >= 0) & (ix < n_columns) & (iy >= 0) & (iy < n_rows)
+    cells = np.ravel_multi_index((groups[on_grid], iy[on_grid], ix[on_grid]), shape)
+
+    # bincount always accumulates in float64; the grids only feed a plot, so float32 halves the
+    # memory traffic of the smoothing passes without any visible loss
+    xgoals_sum = np.bincount(cells, weights=xgoal[on_grid], minlength=np.prod(shape))
+    xgoals_sum = xgoals_sum.reshape(shape).astype(np.float32)
+    shot_counts = np.bincount(cells, minlength=np.prod(shape)).reshape(shape).astype(np.float32)
+
+    # Smooth both stacks and divide, giving the local average xGoal around each cell; sparse cells
+    #   are divided by MIN_SMOOTHED_COUNT so they fade out rather than end in a hard edge
+    xgoals_sum = smooth_grid(xgoals_sum)
+    shot_counts = smooth_grid(shot_counts)
+    xgoals_smooth = xgoals_sum / np.maximum(shot_counts, np.float32(MIN_SMOOTHED_COUNT))
+
+    # The cleansing rules leave no shots behind the goal line, so don't extrapolate values there
+    xgoals_smooth[..., PLOTTED_COLUMNS:] = 0
+    return xgoals_smooth
+
+def smooth_xgoals(x, y, xgoal):
+    """
+    Turns shot locations and their xGoal values into a single smoothed average xGoal grid.
+    Takes plain NumPy arrays so callers pay the pandas indexing cost once.
+
+    Args:
+        x (np.array): Adjusted x coordinates of the shots (0 to 100).
+        y (np.array): Adjusted y coordinates of the shots (-42.5 to 42.5).
+        xgoal (np.array): xGoal value of each shot.
+
+    Returns:
+        np.array: Smoothed xGoals array of shape (85, 100), indexed [y, x].
+    """
+    return smooth_xgoals_batch(np.zeros(len(x), dtype=np.intp), 1, x, y, xgoal)[0]
+
+def rasterize_xgoals(df):
+    """
+    Rasterizes the shots of a DataFrame into a smoothed average xGoal grid (see smooth_xgoals).
+
+    Args:
+        df (DataFrame): Shot data with 'xCordAdjusted', 'yCordAdjusted', and 'xGoal' columns.
+
+    Returns:
+        np.array: Smoothed xGoals array of shape (85, 100), indexed [y, x].
+    """
+    return smooth_xgoals(df['xCordAdjusted'].to_numpy(), df['yCordAdjusted'].to_numpy(), df['xGoal'].to_numpy())
+
 def generate_league_xgoals_smooth(data):
     """
     Generates a league-wide smoothed xGoal heatmap by averaging shot data across all players.
@@ -42,24 +252,130 @@ def generate_league_xgoals_smooth(data):
     Returns:
         league_xgoals_smooth (np.array): Smoothed xGoals array for the league.
     """
-    # Define a grid for interpolation
-    [x, y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-    
-    # Interpolate league-wide xGoal values on the grid
-    league_xgoals = griddata(
-        (data['xCordAdjusted'], data['yCordAdjusted']),
-        data['xGoal'],
-        (x, y), method='cubic', fill_value=0
-    )
-    
-    # Replace any negative values with zero (if needed)
-    league_xgoals = np.where(league_xgoals < 0, 0, league_xgoals)
-    
-    # Smooth the league-wide xGoal data
-    league_xgoals_smooth = gaussian_filter(league_xgoals, sigma=3)
+    league_xgoals_smooth = rasterize_xgoals(data)
     
     return league_xgoals_smooth
 
+# League grids already computed in this process, keyed by id() of the shot DataFrame.
+# The DataFrame itself is kept alongside the grid so its id cannot be recycled.
+_league_xgoals_cache = {}
+
+def cached_league_xgoals_smooth(data):
+    """
+    Returns the league-wide smoothed xGoal heatmap for `data`, computing it only once
+    per DataFrame so that generating several reports does not redo the league grid.
+
+    Args:
+        data (DataFrame): DataFrame containing shot data for all players.
+
+    Returns:
+        np.array: Smoothed xGoals array for the league.
+    """
+    cached = _league_xgoals_cache.get(id(data))
+    if cached is not None and cached[0] is data:
+        return cached[1]
+
+    league_xgoals_smooth = generate_league_xgoals_smooth(data)
+    _league_xgoals_cache.clear()
+    _league_xgoals_cache[id(data)] = (data, league_xgoals_smooth)
+    return league_xgoals_smooth
+
+def generate_players_xgoals_smooth(data, player_names):
+    """
+    Generates the smoothed xGoal heatmap of several players in one batched pass over the shot
+    data, instead of one pass per player.
+
+    Args:
+        data (DataFrame): DataFrame containing shot data for all players.
+        player_names (list): Names of the players to generate heatmaps for.
+
+    Returns:
+        dict: Smoothed xGoals array for each player name.
+    """
+    player_codes = pd.Categorical(data['shooterName'], categories=player_names).codes
+    selected = player_codes >= 0
+
+    players_xgoals_smooth = smooth_xgoals_batch(
+        player_codes[selected].astype(np.intp), len(player_names),
+        data['xCordAdjusted'].to_numpy()[selected],
+        data['yCordAdjusted'].to_numpy()[selected],
+        data['xGoal'].to_numpy()[selected]
+    )
+    return dict(zip(player_names, players_xgoals_smooth))
+
+def report_figure():
+    """
+    Creates a 10 x 12 in figure for a report heatmap, bound directly to an Agg canvas so no
+    pyplot figure manager or GUI backend is involved and nothing stays alive after saving.
+
+    Returns:
+        tuple: The Figure and its single Axes.
+    """
+    fig = Figure(figsize=(10, 12), facecolor='w', edgecolor='k')
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+# Resolution of the heatmap PNGs; they are embedded 180 mm wide, so more pixels only add file size
+HEATMAP_DPI = 72
+
+def save_figure_png(fig, output_path):
+    """
+    Saves a report figure as an RGB PNG. FPDF splits the alpha channel out of RGBA PNGs pixel by
+    pixel in Python when embedding them, so the opaque figure is rendered in memory and written
+    without one.
+
+    Args:
+        fig (Figure): Report figure to save.
+        output_path (str): Path of the PNG file to write.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=HEATMAP_DPI, bbox_inches='tight')
+    buffer.seek(0)
+    Image.open(buffer).convert('RGB').save(output_path)
+
+# Data limits of the half rink drawn behind the comparison heatmaps
+RINK_EXTENT = (-0.5, 100.5, -43, 43)
+
+@functools.lru_cache(maxsize=1)
+def rink_background():
+    """
+    Renders the half rink once as an RGBA image. Comparison heatmaps show this image instead of
+    rebuilding every rink arc, circle and line on each new figure.
+
+    Returns:
+        np.array: RGBA image of the half rink covering RINK_EXTENT.
+    """
+    # Match the size of the rink axes in the 10 x 12 in report figures so line widths are unchanged
+    width = 7.75
+    fig = Figure(figsize=(width, width * 86 / 101))
+    fig.patch.set_alpha(0)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_axes([0, 0, 1, 1])
+    HockeyRink.HockeyRink(board_radius=28, alpha=1).draw(ax, plot_half=True)
+    ax.axis('off')
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+# Each grid cell becomes a HEATMAP_CELL_PIXELS square block of pixels in the plain heatmap PNGs
+HEATMAP_CELL_PIXELS = 6
+
+def save_heatmap_png(grid, output_path):
+    """
+    Saves a smoothed xGoals grid as a viridis PNG, colouring the cells directly instead of going
+    through a matplotlib figure. Used for the heatmaps without a rink overlay.
+
+    Args:
+        grid (np.array): Smoothed xGoals array, with the row of the lowest y first.
+        output_path (str): Path of the PNG file to write.
+    """
+    value_range = np.ptp(grid)
+    normalized = (grid - grid.min()) / value_range if value_range > 0 else np.zeros_like(grid)
+
+    # Put the lowest y at the bottom of the image, as imshow(origin='lower') did
+    pixels = cm.viridis(np.flipud(normalized), bytes=True)[:, :, :3]
+    pixels = pixels.repeat(HEATMAP_CELL_PIXELS, axis=0).repeat(HEATMAP_CELL_PIXELS, axis=1)
+    Image.fromarray(pixels).save(output_path)
+
 # Step 2: Define Player Class
 class Player:
     def __init__(self, player_name, data):
@@ -70,41 +386,83 @@ class Player:
             player_name (str): Name of the player.
             data (DataFrame): DataFrame containing shot data for all players.
         """
-        self.player_name = player_name
-
-        # Check if the player exists in the dataset
-        if player_name not in data['shooterName'].values:
+        # A single comparison on the shooter codes both checks that the player exists in the
+        # dataset and selects their shots
+        is_player = (data['shooterName'] == player_name).to_numpy()
+        if not is_player.any():
             print(f"Error: Player '{player_name}' not found in the data.")
             # Allow user to retry by prompting them for a valid name
             raise ValueError(f"Player '{player_name}' not found in the dataset.")
 
-        self.data = data[data['shooterName'] == player_name]
-        self.total_shots = len(self.data)
+        self._set_shots(player_name, data[is_player])
+
+    @classmethod
+    def from_groups(cls, player_name, data, groups):
+        """
+        Creates a Player from precomputed row positions instead of scanning the whole dataset,
+        which keeps building many players from the same data linear in its size.
+
+        Args:
+            player_name (str): Name of the player.
+            data (DataFrame): DataFrame containing shot data for all players.
+            groups (dict): Row positions of each player's shots in `data`, as returned by
+                           `data.groupby('shooterName', sort=False, observed=True).indices`.
+        """
+        if player_name not in groups:
+            print(f"Error: Player '{player_name}' not found in the data.")
+            raise ValueError(f"Player '{player_name}' not found in the dataset.")
+
+        player = cls.__new__(cls)
+        player._set_shots(player_name, data.iloc[groups[player_name]])
+        return player
+
+    def _set_shots(self, player_name, player_data):
+        """
+        Sets up every attribute of a Player from its already selected shots. Shared by __init__
+        and from_groups so both constructors always build the same object.
+
+        Args:
+            player_name (str): Name of the player.
+            player_data (DataFrame): The player's shots.
+        """
+        self.player_name = player_name
+        self.data = player_data
+        self.total_shots = len(player_data)
+        self._player_smooth = None
+
+    def get_smoothed_xgoals(self):
+        """
+        Returns the smoothed xGoal heatmap of the player's shots, computing it on first use and
+        reusing it for every later heatmap of the same player.
+
+        Returns:
+            np.array: Smoothed xGoals array for the player.
+        """
+        if self._player_smooth is None:
+            self._player_smooth = rasterize_xgoals(self.data)
+        return self._player_smooth
         
     def get_basic_stats(self):
         """Calculate basic statistics such as total shots, goals, and shooting percentage."""
-        goals = self.data[self.data['event'] == 'GOAL']
-        shooting_percentage = len(goals) / self.total_shots * 100 if self.total_shots > 0 else 0
+        goals = int(np.count_nonzero(self.data['event'].values == 'GOAL'))
+        shooting_percentage = goals / self.total_shots * 100 if self.total_shots > 0 else 0
         return {
             "Total Shots": self.total_shots,
-            "Goals": len(goals),
+            "Goals": goals,
             "Shooting Percentage (%)": shooting_percentage
         }
 
-    def shot_heatmap(self, output_dir="heatmaps"):
+    def shot_heatmap(self, output_dir="heatmaps", player_smooth=None):
         """
         Creates a smoothed heatmap of shot probability (xGoal) for the player and returns the file path of the saved PNG.
 
         Args:
             output_dir (str): Directory to save the generated heatmap file.
+            player_smooth (np.array, optional): Precomputed smoothed xGoals array for the player.
+                                                Defaults to `get_smoothed_xgoals()`.
         """
-        [x, y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-        xgoals_player = griddata(
-            (self.data['xCordAdjusted'], self.data['yCordAdjusted']),
-            self.data['xGoal'], (x, y), method='cubic', fill_value=0
-        )
-        xgoals_player = np.where(xgoals_player < 0, 0, xgoals_player)
-        player_shots_smooth = gaussian_filter(xgoals_player, sigma=3)
+        if player_smooth is None:
+            player_smooth = self.get_smoothed_xgoals()
         
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -112,26 +470,23 @@ class Player:
         # Define the path for the output PNG file
         output_path = os.path.join(output_dir, f"{self.player_name}_xGoal_Smoothed_Heatmap.png")
         
-        # Create the figure and plot the heatmap
-        fig = plt.figure(figsize=(10, 12), facecolor='w', edgecolor='k')
-        plt.imshow(player_shots_smooth, origin='lower')
-        plt.colorbar(orientation='horizontal', pad=0.05)
-        plt.title(f'{self.player_name} xGoal Smoothed Array', fontdict={'fontsize': 15})
-        
         # Save the heatmap image to the specified output path
-        plt.savefig(output_path)
-        plt.close()  # Close the figure to free up memory
+        save_heatmap_png(player_smooth, output_path)
         
         # Return the file path of the saved heatmap image
         return output_path
 
-    def compare_with_league(self, data=None, output_dir="heatmaps"):
+    def compare_with_league(self, data=None, output_dir="heatmaps", league_smooth=None, player_smooth=None):
         """
         Compares player's xGoal heatmap with league average and returns the file path of the saved PNG.
 
         Args:
             data (DataFrame, optional): League-wide shot data for comparison. Defaults to None.
             output_dir (str): Directory to save the generated heatmap file.
+            league_smooth (np.array, optional): Precomputed league smoothed xGoals array.
+                                                Computed (and cached) from `data` if not given.
+            player_smooth (np.array, optional): Precomputed smoothed xGoals array for the player.
+                                                Defaults to `get_smoothed_xgoals()`.
 
         Returns:
             str: File path of the saved comparison heatmap.
@@ -139,22 +494,16 @@ class Player:
         if data is None:
             data = self.data
 
-        [x, y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-        xgoals_player = griddata(
-            (self.data['xCordAdjusted'], self.data['yCordAdjusted']),
-            self.data['xGoal'],
-            (x, y), method='cubic', fill_value=0
-        )
-        xgoals_player = np.where(xgoals_player < 0, 0, xgoals_player)
-        
-        # Smooth the player's xGoal data
-        player_shots_smooth = gaussian_filter(xgoals_player, sigma=3)
+        if player_smooth is None:
+            player_smooth = self.get_smoothed_xgoals()
 
-        # Smooth the league's xGoals
-        league_xgoals_smooth = generate_league_xgoals_smooth(data)
+        # Smooth the league's xGoals, reusing the grid if it was already computed
+        if league_smooth is None:
+            league_smooth = cached_league_xgoals_smooth(data)
 
-        # Calculate the difference heatmap
-        difference = player_shots_smooth - league_xgoals_smooth
+        # Calculate the difference heatmap, only over the columns up to the goal line that are plotted;
+        # subtracting the sliced views allocates just the visible part
+        difference = np.subtract(player_smooth[:, :PLOTTED_COLUMNS], league_smooth[:, :PLOTTED_COLUMNS])
 
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -163,28 +512,29 @@ class Player:
         output_path = os.path.join(output_dir, f"{self.player_name}_League_xGoal_Comparison.png")
 
         # Plot the difference heatmap with rink overlay
-        fig, ax = plt.subplots(1, 1, figsize=(10, 12), facecolor='w', edgecolor='k')
-        rink = HockeyRink.HockeyRink(board_radius=28, alpha=1)
-        rink.draw(ax, plot_half=True)
+        fig, ax = report_figure()
+        ax.imshow(rink_background(), extent=RINK_EXTENT, zorder=0)
+        ax.set_xlim(RINK_EXTENT[:2])
+        ax.set_ylim(RINK_EXTENT[2:])
 
-        img = ax.imshow(difference, extent=(0, 89, -42.5, 42.5), cmap='bwr', origin='lower', alpha=0.4)
-        fig.colorbar(img, orientation="horizontal", pad=0.05)
-        plt.title(f'{self.player_name} vs League xGoal Difference', fontdict={'fontsize': 15})
-        plt.axis('off')
+        img = ax.imshow(difference, extent=(0, PLOTTED_COLUMNS, GRID_Y_MIN, -GRID_Y_MIN),
+                        cmap='bwr', origin='lower', alpha=0.4)
+        fig.colorbar(img, ax=ax, orientation="horizontal", pad=0.05)
+        ax.set_title(f'{self.player_name} vs League xGoal Difference', fontdict={'fontsize': 15})
+        ax.axis('off')
 
         # Save the heatmap image to the specified output path
-        plt.savefig(output_path)
-        plt.close()
+        save_figure_png(fig, output_path)
 
         # Return the file path of the saved heatmap image
         return output_path
 
     def high_danger_shots(self, distance_threshold=20):
         """Calculate high-danger shots based on a distance threshold."""
-        high_danger_shots = self.data[self.data['shotDistance'] <= distance_threshold]
+        high_danger_shots = int(np.count_nonzero(self.data['shotDistance'].values <= distance_threshold))
         return {
-            "High Danger Shots": len(high_danger_shots),
-            "High Danger Shot %": len(high_danger_shots) / self.total_shots * 100 if self.total_shots > 0 else 0
+            "High Danger Shots": high_danger_shots,
+            "High Danger Shot %": high_danger_shots / self.total_shots * 100 if self.total_shots > 0 else 0
         }
 
 class Team:
@@ -200,7 +550,12 @@ class Team:
         self.team_name = team_name
         self.shot_data = shot_data
         self.skaters_data = skaters_data
+
+        # Select the team's shots once; the team heatmaps and player lookups all work on this subset
+        roster = skaters_data.loc[skaters_data['team'] == team_name, 'name'].unique()
+        self.team_shot_data = shot_data[shot_data['shooterName'].isin(roster).to_numpy()]
         self.players = self.get_team_players()
+        self._team_smooth = None
 
     def get_team_players(self):
         """
@@ -212,12 +567,26 @@ class Team:
         team_players = self.skaters_data[self.skaters_data['team'] == self.team_name]
         player_objects = []
 
+        # Locate every shooter's rows in a single pass over the team's shots
+        groups = self.team_shot_data.groupby('shooterName', sort=False, observed=True).indices
+
         for player_name in team_players['name'].unique():
-            player_data = self.shot_data[self.shot_data['shooterName'] == player_name]
-            if not player_data.empty:
-                player_objects.append(Player(player_name, player_data))
+            if player_name in groups:
+                player_objects.append(Player.from_groups(player_name, self.team_shot_data, groups))
         
         return player_objects
+
+    def get_smoothed_xgoals(self):
+        """
+        Returns the smoothed xGoal heatmap of the team's shots, computing it on first use and
+        reusing it for the team comparison heatmap.
+
+        Returns:
+            np.array: Smoothed xGoals array for the team.
+        """
+        if self._team_smooth is None:
+            self._team_smooth = rasterize_xgoals(self.team_shot_data)
+        return self._team_smooth
     
     def get_basic_stats(self):
         """
@@ -226,20 +595,20 @@ class Team:
         Returns:
             dict: A dictionary containing total shots, total goals, and average shooting percentage for the team.
         """
-        total_shots = 0
-        total_goals = 0
-        total_shooting_percentage = 0.0
-        player_count = len(self.players)
-
-        # Aggregate stats from each player
-        for player in self.players:
-            stats = player.get_basic_stats()
-            total_shots += stats["Total Shots"]
-            total_goals += stats["Goals"]
-            total_shooting_percentage += stats["Shooting Percentage (%)"]
+        # Count every player's shots and goals in one pass over the team's shots
+        shooter_codes, _ = pd.factorize(self.team_shot_data['shooterName'])
+        is_goal = self.team_shot_data['event'].to_numpy() == 'GOAL'
+        player_shots = np.bincount(shooter_codes)
+        player_goals = np.bincount(shooter_codes, weights=is_goal)
+
+        total_shots = len(self.team_shot_data)
+        total_goals = int(np.count_nonzero(is_goal))
 
         # Calculate average shooting percentage across players
-        avg_shooting_percentage = total_shooting_percentage / player_count if player_count > 0 else 0
+        has_shots = player_shots > 0
+        avg_shooting_percentage = (
+            float(np.mean(player_goals[has_shots] / player_shots[has_shots]) * 100) if has_shots.any() else 0
+        )
 
         return {
             "Team": self.team_name,
@@ -259,21 +628,7 @@ class Team:
         Returns:
             str: Full path to the saved heatmap image.
         """
-        # Combine shot data from all players on the team
-        team_data = pd.concat([player.data for player in self.players], ignore_index=True)
-        
-        # Set up the mesh grid for heatmap
-        [x, y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-        
-        # Interpolate shot probabilities (xGoal) over the grid
-        xgoals_team = griddata(
-            (team_data['xCordAdjusted'], team_data['yCordAdjusted']),
-            team_data['xGoal'], (x, y), method='cubic', fill_value=0
-        )
-        
-        # Ensure no negative values and smooth the heatmap
-        xgoals_team = np.where(xgoals_team < 0, 0, xgoals_team)
-        team_shots_smooth = gaussian_filter(xgoals_team, sigma=3)
+        team_shots_smooth = self.get_smoothed_xgoals()
         
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -281,20 +636,13 @@ class Team:
         # Define the path for the team heatmap PNG file
         output_path = os.path.join(output_dir, f"{self.team_name}_xGoal_Smoothed_Heatmap.png")
         
-        # Plot the heatmap
-        fig = plt.figure(figsize=(10, 12), facecolor='w', edgecolor='k')
-        plt.imshow(team_shots_smooth, origin='lower')
-        plt.colorbar(orientation='horizontal', pad=0.05)
-        plt.title(f'{self.team_name} xGoal Smoothed Array', fontdict={'fontsize': 15})
-        
         # Save the heatmap image
-        plt.savefig(output_path)
-        plt.close()
+        save_heatmap_png(team_shots_smooth, output_path)
 
         # Return the file path of the saved heatmap image
         return output_path
 
-    def compare_with_league(self, league_data=None, output_dir="heatmaps"):
+    def compare_with_league(self, league_data=None, output_dir="heatmaps", league_smooth=None):
         """
         Compares the team's shot probability heatmap with the league's shot probability heatmap and returns
         the file path of the saved difference heatmap.
@@ -302,6 +650,8 @@ class Team:
         Args:
             league_data (DataFrame): DataFrame containing league-wide shot data for comparison.
             output_dir (str): Directory to save the generated heatmap file.
+            league_smooth (np.array, optional): Precomputed league smoothed xGoals array.
+                                                Computed (and cached) from `league_data` if not given.
 
         Returns:
             str: File path of the saved team vs. league difference heatmap.
@@ -310,23 +660,14 @@ class Team:
         if league_data is None:
             league_data = self.shot_data
 
-        # Combine shot data for all players on the team
-        team_data = pd.concat([player.data for player in self.players], ignore_index=True)
+        team_shots_smooth = self.get_smoothed_xgoals()
 
-        # Generate team's xGoals on a grid
-        [x, y] = np.round(np.meshgrid(np.linspace(0, 100, 100), np.linspace(-42.5, 42.5, 85)))
-        xgoals_team = griddata(
-            (team_data['xCordAdjusted'], team_data['yCordAdjusted']),
-            team_data['xGoal'], (x, y), method='cubic', fill_value=0
-        )
-        xgoals_team = np.where(xgoals_team < 0, 0, xgoals_team)
-        team_shots_smooth = gaussian_filter(xgoals_team, sigma=3)
-
-        # Generate league's xGoals smooth heatmap
-        league_xgoals_smooth = generate_league_xgoals_smooth(league_data)
+        # Generate league's xGoals smooth heatmap, reusing the grid if it was already computed
+        if league_smooth is None:
+            league_smooth = cached_league_xgoals_smooth(league_data)
 
-        # Calculate the difference between the team and league heatmaps
-        difference = team_shots_smooth - league_xgoals_smooth
+        # Calculate the difference between the team and league heatmaps over the plotted columns
+        difference = np.subtract(team_shots_smooth[:, :PLOTTED_COLUMNS], league_smooth[:, :PLOTTED_COLUMNS])
 
         # Ensure the output directory exists
         os.makedirs(output_dir, exist_ok=True)
@@ -335,18 +676,19 @@ class Team:
         output_path = os.path.join(output_dir, f"{self.team_name}_League_xGoal_Comparison.png")
 
         # Plot the difference heatmap with rink overlay
-        fig, ax = plt.subplots(1, 1, figsize=(10, 12), facecolor='w', edgecolor='k')
-        rink = HockeyRink.HockeyRink(board_radius=28, alpha=1)
-        rink.draw(ax, plot_half=True)
+        fig, ax = report_figure()
+        ax.imshow(rink_background(), extent=RINK_EXTENT, zorder=0)
+        ax.set_xlim(RINK_EXTENT[:2])
+        ax.set_ylim(RINK_EXTENT[2:])
 
-        img = ax.imshow(difference, extent=(0, 89, -42.5, 42.5), cmap='bwr', origin='lower', alpha=0.4)
-        fig.colorbar(img, orientation="horizontal", pad=0.05)
-        plt.title(f'{self.team_name} vs League xGoal Difference', fontdict={'fontsize': 15})
-        plt.axis('off')
+        img = ax.imshow(difference, extent=(0, PLOTTED_COLUMNS, GRID_Y_MIN, -GRID_Y_MIN),
+                        cmap='bwr', origin='lower', alpha=0.4)
+        fig.colorbar(img, ax=ax, orientation="horizontal", pad=0.05)
+        ax.set_title(f'{self.team_name} vs League xGoal Difference', fontdict={'fontsize': 15})
+        ax.axis('off')
 
         # Save the heatmap image
-        plt.savefig(output_path)
-        plt.close()
+        save_figure_png(fig, output_path)
 
         # Return the file path of the saved heatmap image
         return output_path
@@ -362,19 +704,23 @@ class Team:
             dict: Dictionary with total high-danger shots and percentage of high-danger shots for the team.
         """
         # Filter shots within the high-danger threshold across all players
-        high_danger_shots = self.shot_data[self.shot_data['shotDistance'] <= distance_threshold]
+        high_danger_shots = int(np.count_nonzero(self.shot_data['shotDistance'].values <= distance_threshold))
         
         # Calculate total shots for the team
         total_team_shots = len(self.shot_data)
 
         return {
-            "High Danger Shots": len(high_danger_shots),
-            "High Danger Shot %": (len(high_danger_shots) / total_team_shots * 100) if total_team_shots > 0 else 0
+            "High Danger Shots": high_danger_shots,
+            "High Danger Shot %": (high_danger_shots / total_team_shots * 100) if total_team_shots > 0 else 0
         }
 
 
 
-def generate_player_report(player_name, data):
+def format_stats(stats):
+    """Formats a stats dictionary as one "stat: value" line per entry, written to the PDF in a single multi_cell."""
+    return "\n".join(f"{stat}: {value}" for stat, value in stats.items())
+
+def generate_player_report(player_name, data, league_smooth=None):
     # Step 1: Create a Player object
     player = Player(player_name, data)
     
@@ -385,7 +731,7 @@ def generate_player_report(player_name, data):
     heatmap_image_path = player.shot_heatmap()
 
     # Step 4: Generate league comparison image and save the path
-    league_comparison_image_path = player.compare_with_league(data)
+    league_comparison_image_path = player.compare_with_league(data, league_smooth=league_smooth)
 
     # Step 5: Generate high danger shots stats
     high_danger_stats = player.high_danger_shots()
@@ -403,14 +749,12 @@ def generate_player_report(player_name, data):
     # Add basic stats section
     pdf.set_font("Arial", size=12)
     pdf.cell(200, 10, "Basic Stats:", ln=True)
-    for stat, value in basic_stats.items():
-        pdf.cell(200, 10, f"{stat}: {value}", ln=True)
+    pdf.multi_cell(0, 10, format_stats(basic_stats), align="L")
     pdf.ln(10)
 
     # Add high danger shots section
     pdf.cell(200, 10, "High Danger Shots:", ln=True)
-    for stat, value in high_danger_stats.items():
-        pdf.cell(200, 10, f"{stat}: {value}", ln=True)
+    pdf.multi_cell(0, 10, format_stats(high_danger_stats), align="L")
     pdf.ln(10)
 
     # Add Heatmap Image (first page)
@@ -433,7 +777,65 @@ def generate_player_report(player_name, data):
     print(f"Report generated successfully: {report_filename}")
     return report_filename
 
-def generate_team_report(team_name, shot_data, team_data):
+# Below this many players, starting worker processes costs more than rendering in this process
+MIN_PARALLEL_PLAYERS = 4
+
+# Shot data and league grid of the current report worker process, set once by its initializer
+_worker_data = None
+_worker_league_smooth = None
+
+def _init_report_worker(data, league_smooth):
+    global _worker_data, _worker_league_smooth
+    _worker_data = data
+    _worker_league_smooth = league_smooth
+
+def _generate_worker_player_report(player_name):
+    return generate_player_report(player_name, _worker_data, league_smooth=_worker_league_smooth)
+
+def generate_player_reports(player_names, data, max_workers=None):
+    """
+    Generates the PDF report of several players in parallel worker processes. The league heatmap
+    is computed once, and it is sent to each worker with the shot data when the worker starts
+    instead of with every task.
+
+    Worker processes re-import the calling script under the "spawn" and "forkserver" start methods
+    (the defaults on macOS, Windows and Python 3.14+), so scripts must call this under an
+    `if __name__ == "__main__":` guard. With `max_workers=1`, or fewer than MIN_PARALLEL_PLAYERS
+    players, the reports are generated in this process instead.
+
+    Args:
+        player_names (list): Names of the players to generate reports for.
+        data (DataFrame): DataFrame containing shot data for all players.
+        max_workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        list: File names of the generated reports, in the order of `player_names`.
+    """
+    league_smooth = cached_league_xgoals_smooth(data)
+
+    if max_workers == 1 or len(player_names) < MIN_PARALLEL_PLAYERS:
+        return [generate_player_report(player_name, data, league_smooth=league_smooth)
+                for player_name in player_names]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_report_worker,
+                             initargs=(data, league_smooth)) as pool:
+        return list(pool.map(_generate_worker_player_report, player_names))
+
+def _render_player(player, league_smooth, player_smooth, heatmaps_dir):
+    """
+    Computes one player's stats and saves their two heatmaps for the team report. Players are
+    independent of each other, so this runs in worker processes.
+
+    Returns:
+        tuple: Basic stats, high danger stats, shot heatmap path and league comparison path.
+    """
+    heatmap_path = player.shot_heatmap(output_dir=heatmaps_dir, player_smooth=player_smooth)
+    comparison_path = player.compare_with_league(
+        output_dir=heatmaps_dir, league_smooth=league_smooth, player_smooth=player_smooth
+    )
+    return player.get_basic_stats(), player.high_danger_shots(), heatmap_path, comparison_path
+
+def generate_team_report(team_name, shot_data, team_data, max_workers=None):
     """
     Generates a PDF report for the specified team, including a summary of team statistics,
     a team-level shot heatmap, individual reports for each player, and comparisons to the league average.
@@ -442,13 +844,18 @@ def generate_team_report(team_name, shot_data, team_data):
         team_name (str): Name of the team.
         shot_data (DataFrame): DataFrame containing shot data for all players.
         team_data (DataFrame): DataFrame containing player information and performance data for the team.
+        max_workers (int, optional): Number of worker processes rendering the player heatmaps.
+                                     Defaults to the number of CPUs; 1 renders them in this process.
+
+    The worker processes re-import the calling script under the "spawn" and "forkserver" start
+    methods, so scripts must call this under an `if __name__ == "__main__":` guard unless
+    `max_workers=1` or the team has fewer than MIN_PARALLEL_PLAYERS players.
     """
     # Initialize Team object
     team = Team(team_name, shot_data, team_data)
     
-    # Define the heatmaps directory
-    heatmaps_dir = "heatmaps"
-    os.makedirs(heatmaps_dir, exist_ok=True)
+    # Write the heatmaps to a private temporary directory, removed once the PDF is saved
+    heatmaps_dir = tempfile.mkdtemp(prefix="heatmaps_")
     
     try:
         # Create a PDF object
@@ -464,14 +871,12 @@ def generate_team_report(team_name, shot_data, team_data):
         # Calculate and add team basic stats
         team_stats = team.get_basic_stats()
         pdf.set_font("Arial", size=12)
-        for stat, value in team_stats.items():
-            pdf.cell(0, 10, f"{stat}: {value}", ln=True)
+        pdf.multi_cell(0, 10, format_stats(team_stats), align="L")
         pdf.ln(10)
         
         # Add team high danger shots
         high_danger_stats = team.high_danger_shots()
-        for stat, value in high_danger_stats.items():
-            pdf.cell(0, 10, f"{stat}: {value}", ln=True)
+        pdf.multi_cell(0, 10, format_stats(high_danger_stats), align="L")
         pdf.ln(10)
         
         # Generate and add Team Heatmap
@@ -480,40 +885,56 @@ def generate_team_report(team_name, shot_data, team_data):
         pdf.image(team_heatmap_path, x=10, y=pdf.get_y() + 5, w=180)
         pdf.add_page()
         
+        # The league heatmap is the same for the team and every player, so compute it once
+        league_smooth = cached_league_xgoals_smooth(shot_data)
+
         # League comparison heatmap for the team
-        team_vs_league_path = team.compare_with_league(league_data=shot_data, output_dir=heatmaps_dir)
+        team_vs_league_path = team.compare_with_league(
+            league_data=shot_data, output_dir=heatmaps_dir, league_smooth=league_smooth
+        )
         pdf.cell(0, 10, "Team vs. League Shot Heatmap:", ln=True)
         pdf.image(team_vs_league_path, x=10, y=pdf.get_y() + 5, w=180)
         
+        # Smooth every player's shots in one batched pass for the individual reports
+        players_xgoals_smooth = generate_players_xgoals_smooth(
+            team.team_shot_data, [player.player_name for player in team.players]
+        )
+
+        # Render every player's stats and heatmaps, in parallel worker processes unless the roster
+        #   is small; only the PDF pages are written here, in roster order
+        render_args = (
+            team.players,
+            repeat(league_smooth),
+            [players_xgoals_smooth[player.player_name] for player in team.players],
+            repeat(heatmaps_dir)
+        )
+        if max_workers == 1 or len(team.players) < MIN_PARALLEL_PLAYERS:
+            player_results = list(map(_render_player, *render_args))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                player_results = list(pool.map(_render_player, *render_args))
+
         # Individual Player Reports
-        for player in team.players:
+        for player, (player_stats, high_danger_stats, heatmap_path, comparison_path) in zip(team.players, player_results):
             pdf.add_page()
             
-            # Get player stats
-            player_stats = player.get_basic_stats()
-            high_danger_stats = player.high_danger_shots()
-            
             # Add player header
             pdf.set_font("Arial", "B", 14)
             pdf.cell(0, 10, f"{player.player_name} - Individual Report", ln=True)
             
             # Add player basic stats
             pdf.set_font("Arial", size=12)
-            for stat, value in player_stats.items():
-                pdf.cell(0, 10, f"{stat}: {value}", ln=True)
+            pdf.multi_cell(0, 10, format_stats(player_stats), align="L")
             
             # Add player high danger stats
-            for stat, value in high_danger_stats.items():
-                pdf.cell(0, 10, f"{stat}: {value}", ln=True)
+            pdf.multi_cell(0, 10, format_stats(high_danger_stats), align="L")
             
             # Player Shot Heatmap
-            heatmap_path = player.shot_heatmap(output_dir=heatmaps_dir)
             pdf.ln(10)
             pdf.cell(0, 10, "Player Shot Heatmap:", ln=True)
             pdf.image(heatmap_path, x=10, y=pdf.get_y() + 5, w=180)
             
             # Player League Comparison Heatmap
-            comparison_path = player.compare_with_league(data=shot_data, output_dir=heatmaps_dir)
             pdf.add_page()
             pdf.cell(0, 10, "Comparison with League Heatmap:", ln=True)
             pdf.image(comparison_path, x=10, y=pdf.get_y() + 5, w=180)
@@ -525,13 +946,6 @@ def generate_team_report(team_name, shot_data, team_data):
     
     finally:
         # Clean up the heatmaps folder
-        if os.path.exists(heatmaps_dir):
-            for file in os.listdir(heatmaps_dir):
-                file_path = os.path.join(heatmaps_dir, file)
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    print(f"Error deleting file {file_path}: {e}")
-            os.rmdir(heatmaps_dir)  # Remove the directory itself
+        shutil.rmtree(heatmaps_dir, ignore_errors=True)
 
     return output_filename
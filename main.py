@@ -1,9 +1,12 @@
-from func_class import import_clean_data, Player, Team, generate_player_report, generate_team_report 
+from func_class import load_clean_shots, Player, Team, generate_player_report, generate_team_report 
 import pandas as pd
 
-shoot_data = import_clean_data("shots_2023.csv")
-team_data = pd.read_csv("skaters.csv")
+# The team report renders players in worker processes, which re-import this script on platforms
+#   that spawn them, so the reports only run when the script is executed directly
+if __name__ == "__main__":
+    shoot_data = load_clean_shots("shots_2023.csv")
+    team_data = pd.read_csv("skaters.csv", usecols=['name', 'team'])
 
-generate_player_report('Connor McDavid', shoot_data)
+    generate_player_report('Connor McDavid', shoot_data)
 
-generate_team_report('OTT', shoot_data, team_data)
+    generate_team_report('OTT', shoot_data, team_data)